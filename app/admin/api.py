@@ -2,8 +2,10 @@
 管理后台 API 接口
 用于 htmx 调用的 HTML 片段返回
 """
+import asyncio
 from datetime import datetime
 from html import escape
+import os
 from pathlib import Path
 import re
 from typing import Optional
@@ -96,8 +98,15 @@ async def reload_settings():
     from dotenv import load_dotenv
 
     from app.core.config import settings
+    from app.services.token_automation import (
+        notify_token_automation_settings_changed,
+        snapshot_token_automation_settings,
+    )
     from app.utils.logger import setup_logger
 
+    previous_debug_logging = settings.DEBUG_LOGGING
+    previous_automation_settings = snapshot_token_automation_settings()
+
     # 重新加载 .env 文件
     load_dotenv(override=True)
 
@@ -108,12 +117,31 @@ async def reload_settings():
     for field_name in new_settings.model_fields.keys():
         setattr(settings, field_name, getattr(new_settings, field_name))
 
-    # 重新初始化 logger（使用新的 DEBUG_LOGGING 配置）
-    setup_logger(log_dir="logs", debug_mode=settings.DEBUG_LOGGING)
+    # 仅在 DEBUG_LOGGING 变化时重建日志处理器，避免无谓地重启日志队列线程
+    if settings.DEBUG_LOGGING != previous_debug_logging:
+        setup_logger(log_dir="logs", debug_mode=settings.DEBUG_LOGGING)
+
+    # 仅在自动导入/维护配置变化时唤醒调度器，无关配置保存不打断既定周期
+    current_automation_settings = snapshot_token_automation_settings()
+    changed_automation_keys = [
+        key
+        for key, value in current_automation_settings.items()
+        if previous_automation_settings[key] != value
+    ]
+    if changed_automation_keys:
+        notify_token_automation_settings_changed(changed_automation_keys)
 
     logger.info(f"🔄 配置已热重载 (DEBUG_LOGGING={settings.DEBUG_LOGGING})")
 
 
+_ALERT_LEVEL_CLASSES = {
+    "success": "bg-green-100 border-green-400 text-green-700",
+    "warning": "bg-yellow-100 border-yellow-400 text-yellow-700",
+    "error": "bg-red-100 border-red-400 text-red-700",
+    "info": "bg-blue-100 border-blue-400 text-blue-700",
+}
+
+
 def _build_alert(
     message: str,
     *,
@@ -121,13 +149,7 @@ def _build_alert(
     level: str,
     status_code: int = 200,
 ) -> HTMLResponse:
-    level_classes = {
-        "success": "bg-green-100 border-green-400 text-green-700",
-        "warning": "bg-yellow-100 border-yellow-400 text-yellow-700",
-        "error": "bg-red-100 border-red-400 text-red-700",
-        "info": "bg-blue-100 border-blue-400 text-blue-700",
-    }
-    classes = level_classes.get(level, level_classes["info"])
+    classes = _ALERT_LEVEL_CLASSES.get(level, _ALERT_LEVEL_CLASSES["info"])
     safe_title = escape(title)
     safe_message = escape(message)
     return HTMLResponse(
@@ -265,6 +287,12 @@ def _validate_directory_path(source_dir: str) -> str:
     return str(source_path)
 
 
+# 状态标签与样式只有三种组合，预先定义，渲染时直接按状态取用
+_TOKEN_STATUS_HEALTHY = ("健康", "bg-green-100 text-green-800")
+_TOKEN_STATUS_AVAILABLE = ("可用", "bg-yellow-100 text-yellow-800")
+_TOKEN_STATUS_FAILED = ("失败", "bg-red-100 text-red-800")
+
+
 @router.get("/token-pool", response_class=HTMLResponse)
 async def get_token_pool_status(request: Request):
     """获取 Token 池状态（HTML 片段）"""
@@ -285,24 +313,17 @@ async def get_token_pool_status(request: Request):
     tokens_info = []
 
     for idx, token_info in enumerate(pool_status.get("tokens", []), 1):
-        is_available = token_info.get("is_available", False)
-        is_healthy = token_info.get("is_healthy", False)
-
         # 确定状态和颜色
-        if is_healthy:
-            status = "健康"
-            status_color = "bg-green-100 text-green-800"
-        elif is_available:
-            status = "可用"
-            status_color = "bg-yellow-100 text-yellow-800"
+        if token_info.get("is_healthy", False):
+            status, status_color = _TOKEN_STATUS_HEALTHY
+        elif token_info.get("is_available", False):
+            status, status_color = _TOKEN_STATUS_AVAILABLE
         else:
-            status = "失败"
-            status_color = "bg-red-100 text-red-800"
+            status, status_color = _TOKEN_STATUS_FAILED
 
         # 格式化最后使用时间
         last_success = token_info.get("last_success_time", 0)
         if last_success > 0:
-            from datetime import datetime
             last_used = datetime.fromtimestamp(last_success).strftime("%Y-%m-%d %H:%M:%S")
         else:
             last_used = "从未使用"
@@ -519,7 +540,7 @@ async def reset_config():
 async def get_env_preview():
     """获取 .env 文件预览"""
     try:
-        content = read_env_content()
+        content = await asyncio.to_thread(read_env_content)
         if not content:
             content = "# .env 文件不存在"
         return HTMLResponse(f"<pre>{escape(content)}</pre>")
@@ -527,62 +548,87 @@ async def get_env_preview():
         return HTMLResponse(f"<pre># 读取失败: {escape(str(exc))}</pre>")
 
 
+_LIVE_LOG_LEVEL_STYLES = (
+    (("ERROR", "CRITICAL"), ("text-red-400 font-semibold", "❌")),
+    (("WARNING", "WARN"), ("text-yellow-400", "⚠️")),
+    (("SUCCESS", "✅"), ("text-green-400", "✅")),
+    (("INFO",), ("text-blue-400", "ℹ️")),
+    (("DEBUG",), ("text-gray-400 text-xs", "🔍")),
+)
+_LIVE_LOG_DEFAULT_STYLE = ("text-gray-300", "•")
+_LIVE_LOG_MAX_LINES = 50
+_LIVE_LOG_READ_BLOCK_SIZE = 64 * 1024
+
+
+def _read_log_tail(log_file: str, max_lines: int) -> list[str]:
+    """从文件末尾按块读取最后若干行，避免整份日志逐行解码。"""
+    with open(log_file, "rb") as f:
+        position = f.seek(0, 2)
+        buffer = b""
+        # 多读一行，保证首行完整（可能被块边界截断）
+        while position > 0 and buffer.count(b"\n") <= max_lines:
+            read_size = min(_LIVE_LOG_READ_BLOCK_SIZE, position)
+            position -= read_size
+            f.seek(position)
+            buffer = f.read(read_size) + buffer
+
+    lines = buffer.split(b"\n")
+    if lines and not lines[-1]:
+        lines.pop()
+    return [
+        line.decode("utf-8", errors="replace")
+        for line in lines[-max_lines:]
+    ]
+
+
+def _load_live_log_lines(log_dir: str = "logs") -> list[str]:
+    """读取最新日志文件的末尾若干行；目录或文件不存在时返回空列表。"""
+    try:
+        log_files = sorted(
+            (name for name in os.listdir(log_dir) if name.endswith(".log")),
+            reverse=True,
+        )
+    except OSError:
+        return []
+
+    if not log_files:
+        return []
+
+    try:
+        return _read_log_tail(os.path.join(log_dir, log_files[0]), _LIVE_LOG_MAX_LINES)
+    except Exception as e:
+        return [f"# [{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 读取日志失败: {str(e)}"]
+
+
 @router.get("/live-logs", response_class=HTMLResponse)
 async def get_live_logs():
     """获取实时日志（最新 50 行）"""
-    import os
-    from datetime import datetime
-
-    logs = []
-
-    # 尝试读取日志文件
-    log_dir = "logs"
-    if os.path.exists(log_dir):
-        log_files = sorted([f for f in os.listdir(log_dir) if f.endswith('.log')], reverse=True)
-        if log_files:
-            log_file = os.path.join(log_dir, log_files[0])
-            try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    # 读取最后 50 行
-                    lines = f.readlines()[-50:]
-                    logs = lines
-            except Exception as e:
-                logs = [f"# [{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 读取日志失败: {str(e)}"]
+    # 目录扫描与文件读取放到线程中执行，轮询期间不阻塞事件循环
+    logs = await asyncio.to_thread(_load_live_log_lines)
 
     if not logs:
         logs = [f"# [{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 暂无日志数据"]
 
-    html = ""
+    html_parts = []
     for log in logs:
         log_line = log.strip()
         if not log_line:
             continue
 
         # 根据日志级别设置颜色和样式
-        if "ERROR" in log_line or "CRITICAL" in log_line:
-            color_class = "text-red-400 font-semibold"
-            icon = "❌"
-        elif "WARNING" in log_line or "WARN" in log_line:
-            color_class = "text-yellow-400"
-            icon = "⚠️"
-        elif "SUCCESS" in log_line or "✅" in log_line:
-            color_class = "text-green-400"
-            icon = "✅"
-        elif "INFO" in log_line:
-            color_class = "text-blue-400"
-            icon = "ℹ️"
-        elif "DEBUG" in log_line:
-            color_class = "text-gray-400 text-xs"
-            icon = "🔍"
-        else:
-            color_class = "text-gray-300"
-            icon = "•"
-
-        # 转义 HTML 特殊字符
-        log_escaped = log_line.replace('<', '&lt;').replace('>', '&gt;')
-
-        html += f'<div class="{color_class} py-0.5 hover:bg-gray-800 px-2 rounded transition-colors">{icon} {log_escaped}</div>'
+        color_class, icon = _LIVE_LOG_DEFAULT_STYLE
+        for markers, style in _LIVE_LOG_LEVEL_STYLES:
+            if any(marker in log_line for marker in markers):
+                color_class, icon = style
+                break
+
+        html_parts.append(
+            f'<div class="{color_class} py-0.5 hover:bg-gray-800 '
+            'px-2 rounded transition-colors">'
+            f"{icon} {escape(log_line, quote=False)}</div>"
+        )
 
+    html = "".join(html_parts)
     return HTMLResponse(html)
 
 
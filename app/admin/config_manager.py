@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -10,7 +12,7 @@ from typing import Any, Awaitable, Callable, Mapping
 from dotenv import dotenv_values
 
 from app.core.config import settings
-from app.utils.env_file import update_env_file
+from app.utils.env_file import render_env_updates
 from app.utils.logger import logger
 
 ENV_PATH = Path(".env")
@@ -446,13 +448,42 @@ CONFIG_FIELD_SPECS = {
 }
 MANAGED_ENV_KEYS = tuple(CONFIG_FIELD_SPECS.keys())
 ReloadCallback = Callable[[], Awaitable[None]]
+EnvRenderer = Callable[[str], str]
+
+# 字段的静态渲染信息只依赖元数据，导入时生成一次，渲染时仅合并动态值。
+_FIELD_RENDER_TEMPLATES: dict[str, dict[str, Any]] = {
+    field.key: {
+        "key": field.key,
+        "label": field.label,
+        "description": field.description,
+        "value_type": field.value_type,
+        "input_type": field.input_type,
+        "placeholder": field.placeholder,
+        "required": field.required,
+        "wide": field.wide,
+        "sensitive": field.sensitive,
+        "restart_required": field.restart_required,
+        "min_value": field.min_value,
+        "max_value": field.max_value,
+    }
+    for field in CONFIG_FIELD_SPECS.values()
+}
+_SOURCE_BADGES = {
+    True: (".env", "bg-emerald-50 text-emerald-700 ring-emerald-200"),
+    False: ("默认值", "bg-slate-100 text-slate-600 ring-slate-200"),
+}
+_TOTAL_FIELDS = len(CONFIG_FIELD_SPECS)
+_SENSITIVE_FIELDS = sum(1 for field in CONFIG_FIELD_SPECS.values() if field.sensitive)
+_RESTART_REQUIRED_FIELDS = sum(
+    1 for field in CONFIG_FIELD_SPECS.values() if field.restart_required
+)
 
 
 def read_env_content(env_path: str | Path = ENV_PATH) -> str:
-    path = Path(env_path)
-    if not path.exists():
+    try:
+        return Path(env_path).read_text(encoding="utf-8")
+    except FileNotFoundError:
         return ""
-    return path.read_text(encoding="utf-8")
 
 
 def validate_env_source(content: str) -> str:
@@ -477,52 +508,27 @@ def build_config_page_data(
     env_example_path: str | Path = ENV_EXAMPLE_PATH,
 ) -> dict[str, Any]:
     env_file = Path(env_path)
-    env_content = read_env_content(env_file)
-    env_values = dotenv_values(env_file) if env_file.exists() else {}
+    env_exists, env_content = _snapshot_env_file(env_file)
+    # 复用已读取的文本解析键名，保持与 dotenv 一致的引号/多行值语义
+    env_keys = dotenv_values(stream=io.StringIO(env_content)) if env_content else {}
     sections: list[dict[str, Any]] = []
-    total_fields = 0
     overridden_fields = 0
-    sensitive_fields = 0
-    restart_required_fields = 0
 
     for section in CONFIG_SECTIONS:
         rendered_fields: list[dict[str, Any]] = []
         for field in section.fields:
-            total_fields += 1
-            if field.sensitive:
-                sensitive_fields += 1
-            if field.restart_required:
-                restart_required_fields += 1
-
-            is_overridden = field.key in env_values
+            is_overridden = field.key in env_keys
             if is_overridden:
                 overridden_fields += 1
 
             value = getattr(settings_obj, field.key, field.default_value)
-            if value is None:
-                value = ""
-
+            source_label, source_badge_class = _SOURCE_BADGES[is_overridden]
             rendered_fields.append(
                 {
-                    "key": field.key,
-                    "label": field.label,
-                    "description": field.description,
-                    "value_type": field.value_type,
-                    "value": value,
-                    "input_type": field.input_type,
-                    "placeholder": field.placeholder,
-                    "required": field.required,
-                    "wide": field.wide,
-                    "sensitive": field.sensitive,
-                    "restart_required": field.restart_required,
-                    "min_value": field.min_value,
-                    "max_value": field.max_value,
-                    "source_label": ".env" if is_overridden else "默认值",
-                    "source_badge_class": (
-                        "bg-emerald-50 text-emerald-700 ring-emerald-200"
-                        if is_overridden
-                        else "bg-slate-100 text-slate-600 ring-slate-200"
-                    ),
+                    **_FIELD_RENDER_TEMPLATES[field.key],
+                    "value": "" if value is None else value,
+                    "source_label": source_label,
+                    "source_badge_class": source_badge_class,
                 }
             )
 
@@ -541,12 +547,12 @@ def build_config_page_data(
         "env_content": env_content,
         "overview": {
             "total_sections": len(CONFIG_SECTIONS),
-            "total_fields": total_fields,
+            "total_fields": _TOTAL_FIELDS,
             "overridden_fields": overridden_fields,
-            "default_fields": total_fields - overridden_fields,
-            "sensitive_fields": sensitive_fields,
-            "restart_required_fields": restart_required_fields,
-            "env_exists": env_file.exists(),
+            "default_fields": _TOTAL_FIELDS - overridden_fields,
+            "sensitive_fields": _SENSITIVE_FIELDS,
+            "restart_required_fields": _RESTART_REQUIRED_FIELDS,
+            "env_exists": env_exists,
             "env_path": str(env_file.resolve()),
             "env_line_count": len(env_content.splitlines()) if env_content else 0,
             "example_exists": Path(env_example_path).exists(),
@@ -590,30 +596,77 @@ def build_form_updates(form_data: Mapping[str, Any]) -> dict[str, object]:
     return updates
 
 
+def _snapshot_env_file(path: Path) -> tuple[bool, str]:
+    try:
+        return True, path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return False, ""
+
+
+def _restore_env_file(
+    path: Path,
+    had_existing_file: bool,
+    previous_content: str,
+) -> None:
+    if had_existing_file:
+        path.write_text(previous_content, encoding="utf-8")
+    else:
+        path.unlink(missing_ok=True)
+
+
+def _format_env_content(content: str) -> str:
+    stripped = content.rstrip("\n")
+    return f"{stripped}\n" if stripped else ""
+
+
+_env_change_lock: asyncio.Lock | None = None
+
+
+def _get_env_change_lock() -> asyncio.Lock:
+    global _env_change_lock
+    if _env_change_lock is None:
+        _env_change_lock = asyncio.Lock()
+    return _env_change_lock
+
+
 async def _apply_env_change(
-    writer: Callable[[Path], None],
+    render: EnvRenderer,
     *,
     reload_callback: ReloadCallback,
     env_path: str | Path = ENV_PATH,
 ) -> None:
+    # 文件读写放到线程中执行，避免慢盘或网络盘阻塞事件循环。
+    # 新内容基于同一次快照在内存中生成，内容未变化时跳过写盘。
+    # 串行化并发保存，避免两次快照/写入/回滚交错覆盖彼此的结果。
     path = Path(env_path)
-    had_existing_file = path.exists()
-    previous_content = read_env_content(path) if had_existing_file else ""
-
-    try:
-        writer(path)
-        await reload_callback()
-    except Exception:
-        if had_existing_file:
-            path.write_text(previous_content, encoding="utf-8")
-        elif path.exists():
-            path.unlink()
+    async with _get_env_change_lock():
+        had_existing_file, previous_content = await asyncio.to_thread(
+            _snapshot_env_file,
+            path,
+        )
+        new_content = render(previous_content)
 
         try:
+            if not had_existing_file or new_content != previous_content:
+                await asyncio.to_thread(
+                    path.write_text,
+                    new_content,
+                    encoding="utf-8",
+                )
             await reload_callback()
-        except Exception as restore_exc:
-            logger.warning(f"⚠️ 回滚配置后重新加载失败: {restore_exc}")
-        raise
+        except Exception:
+            await asyncio.to_thread(
+                _restore_env_file,
+                path,
+                had_existing_file,
+                previous_content,
+            )
+
+            try:
+                await reload_callback()
+            except Exception as restore_exc:
+                logger.warning(f"⚠️ 回滚配置后重新加载失败: {restore_exc}")
+            raise
 
 
 async def save_form_config(
@@ -627,10 +680,10 @@ async def save_form_config(
     async def _reload() -> None:
         await reload_callback()
 
-    def _writer(target_path: Path) -> None:
-        update_env_file(updates, env_path=target_path)
+    def _render(previous_content: str) -> str:
+        return render_env_updates(previous_content, updates)
 
-    await _apply_env_change(_writer, reload_callback=_reload, env_path=env_path)
+    await _apply_env_change(_render, reload_callback=_reload, env_path=env_path)
     return updates
 
 
@@ -642,15 +695,11 @@ async def save_source_config(
 ) -> None:
     normalized = validate_env_source(env_content)
 
-    def _writer(target_path: Path) -> None:
-        content = normalized.rstrip("\n")
-        target_path.write_text(
-            f"{content}\n" if content else "",
-            encoding="utf-8",
-        )
+    def _render(previous_content: str) -> str:
+        return _format_env_content(normalized)
 
     await _apply_env_change(
-        _writer,
+        _render,
         reload_callback=reload_callback,
         env_path=env_path,
     )
@@ -663,20 +712,19 @@ async def reset_env_to_example(
     env_example_path: str | Path = ENV_EXAMPLE_PATH,
 ) -> None:
     example_path = Path(env_example_path)
-    if not example_path.exists():
-        raise FileNotFoundError(".env.example 不存在")
-
-    example_content = example_path.read_text(encoding="utf-8")
-
-    def _writer(target_path: Path) -> None:
-        content = example_content.rstrip("\n")
-        target_path.write_text(
-            f"{content}\n" if content else "",
+    try:
+        example_content = await asyncio.to_thread(
+            example_path.read_text,
             encoding="utf-8",
         )
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(".env.example 不存在") from exc
+
+    def _render(previous_content: str) -> str:
+        return _format_env_content(example_content)
 
     await _apply_env_change(
-        _writer,
+        _render,
         reload_callback=reload_callback,
         env_path=env_path,
     )
@@ -1,6 +1,7 @@
 """
 管理后台路由模块
 """
+import asyncio
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Request
@@ -53,7 +54,7 @@ async def dashboard(request: Request):
 )
 async def config_page(request: Request):
     """配置管理页面"""
-    page_data = build_config_page_data()
+    page_data = await asyncio.to_thread(build_config_page_data)
 
     context = {
         "request": request,
@@ -31,7 +31,7 @@ from app.utils.token_pool import get_token_pool
 from app.utils.tool_call_handler import (
     parse_and_extract_tool_calls,
 )
-from app.utils.user_agent import get_random_user_agent
+from app.utils.user_agent import BROWSER_CHOICES, get_random_user_agent
 
 logger = get_logger()
 
@@ -80,16 +80,7 @@ def get_dynamic_headers(
     browser_type: Optional[str] = None,
 ) -> Dict[str, str]:
     """生成上游请求所需的动态浏览器 headers。"""
-    browser_choices = [
-        "chrome",
-        "chrome",
-        "chrome",
-        "edge",
-        "edge",
-        "firefox",
-        "safari",
-    ]
-    selected_browser = browser_type or random.choice(browser_choices)
+    selected_browser = browser_type or random.choice(BROWSER_CHOICES)
     user_agent = get_random_user_agent(selected_browser)
     fe_version = get_latest_fe_version()
 
@@ -395,24 +386,15 @@ class UpstreamClient:
         if not guest_pool:
             return max(2, settings.GUEST_POOL_SIZE + 1)
 
-        pool_status = guest_pool.get_pool_status()
-        available_sessions = int(
-            pool_status.get("valid_sessions")
-            or pool_status.get("available_sessions")
-            or 0
-        )
-        return max(2, available_sessions + 1)
+        return max(2, guest_pool.count_valid_sessions() + 1)
 
     def _get_authenticated_retry_limit(self) -> int:
         """认证号池与静态 Token 可提供的最大重试预算。"""
-        available_tokens = 0
         token_pool = get_token_pool()
-        if token_pool:
-            available_tokens = int(
-                token_pool.get_pool_status().get("available_tokens", 0) or 0
-            )
+        if not token_pool:
+            return 0
 
-        return max(0, available_tokens)
+        return max(0, token_pool.count_available_tokens())
 
     def _get_total_retry_limit(self) -> int:
         """综合认证号池与匿名号池的最大尝试次数。"""
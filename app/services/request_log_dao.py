@@ -14,7 +14,7 @@ from app.models.request_log import DB_PATH, SQL_CREATE_REQUEST_LOGS_TABLE
 from app.utils.logger import logger
 
 
-def _format_sqlite_datetime(value: datetime) -> str:
+def format_sqlite_datetime(value: datetime) -> str:
     """格式化为 SQLite `CURRENT_TIMESTAMP` 兼容的时间字符串。"""
     return value.strftime("%Y-%m-%d %H:%M:%S")
 
@@ -173,6 +173,67 @@ class RequestLogDAO:
             await conn.commit()
             return cursor.lastrowid
 
+    async def add_logs(self, entries: List[Dict]) -> int:
+        """
+        批量添加请求日志（单连接、单次提交）
+
+        Args:
+            entries: 日志字段字典列表，字段与 `add_log` 参数一致，
+                可额外携带 `timestamp` 记录入队时间
+
+        Returns:
+            写入的记录数
+        """
+        if not entries:
+            return 0
+
+        rows = []
+        for entry in entries:
+            input_tokens = entry.get("input_tokens", 0)
+            output_tokens = entry.get("output_tokens", 0)
+            total_tokens = entry.get("total_tokens")
+            if total_tokens is None:
+                total_tokens = input_tokens + output_tokens
+
+            rows.append(
+                (
+                    entry.get("timestamp")
+                    or format_sqlite_datetime(datetime.utcnow()),
+                    entry["provider"],
+                    entry["endpoint"],
+                    entry["source"],
+                    entry["protocol"],
+                    entry["client_name"],
+                    entry["model"],
+                    entry["status_code"],
+                    entry["success"],
+                    entry.get("duration", 0.0),
+                    entry.get("first_token_time", 0.0),
+                    input_tokens,
+                    output_tokens,
+                    entry.get("cache_creation_tokens", 0),
+                    entry.get("cache_read_tokens", 0),
+                    total_tokens,
+                    entry.get("error_message"),
+                )
+            )
+
+        async with self.get_connection() as conn:
+            await conn.executemany(
+                """
+                INSERT INTO request_logs
+                (timestamp, provider, endpoint, source, protocol, client_name,
+                 model, status_code, success, duration, first_token_time,
+                 input_tokens, output_tokens, cache_creation_tokens,
+                 cache_read_tokens, total_tokens, error_message)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            await conn.commit()
+
+        return len(rows)
+
     async def get_recent_logs(
         self,
         limit: int = 100,
@@ -274,8 +335,8 @@ class RequestLogDAO:
         """
         query = "SELECT * FROM request_logs WHERE timestamp BETWEEN ? AND ?"
         params = [
-            _format_sqlite_datetime(start_time),
-            _format_sqlite_datetime(end_time),
+            format_sqlite_datetime(start_time),
+            format_sqlite_datetime(end_time),
         ]
 
         if provider:
@@ -481,7 +542,7 @@ class RequestLogDAO:
             FROM request_logs
             WHERE timestamp >= ?
         """
-        params: List[object] = [_format_sqlite_datetime(start_time)]
+        params: List[object] = [format_sqlite_datetime(start_time)]
 
         if provider:
             query += " AND provider = ?"
@@ -559,7 +620,7 @@ class RequestLogDAO:
                 GROUP BY model
                 ORDER BY total DESC
                 """,
-                (_format_sqlite_datetime(start_time),)
+                (format_sqlite_datetime(start_time),)
             )
             rows = await cursor.fetchall()
 
@@ -600,7 +661,7 @@ class RequestLogDAO:
         async with self.get_connection() as conn:
             cursor = await conn.execute(
                 "DELETE FROM request_logs WHERE timestamp < ?",
-                (_format_sqlite_datetime(cutoff_time),)
+                (format_sqlite_datetime(cutoff_time),)
             )
             await conn.commit()
             return cursor.rowcount
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Iterable, Optional, Set
 
 from app.core.config import settings
 from app.services.token_dao import TokenDAO, get_token_dao
@@ -15,6 +15,23 @@ from app.utils.token_pool import TokenPool, get_token_pool
 DEFAULT_TOKEN_PROVIDER = "zai"
 _AUTO_IMPORT_LOCK = asyncio.Lock()
 _AUTO_MAINTENANCE_LOCK = asyncio.Lock()
+IMPORT_SETTING_KEYS = (
+    "TOKEN_AUTO_IMPORT_ENABLED",
+    "TOKEN_AUTO_IMPORT_SOURCE_DIR",
+    "TOKEN_AUTO_IMPORT_INTERVAL",
+)
+MAINTENANCE_SETTING_KEYS = (
+    "TOKEN_AUTO_MAINTENANCE_ENABLED",
+    "TOKEN_AUTO_MAINTENANCE_INTERVAL",
+    "TOKEN_AUTO_REMOVE_DUPLICATES",
+    "TOKEN_AUTO_HEALTH_CHECK",
+    "TOKEN_AUTO_DELETE_INVALID",
+)
+AUTOMATION_SETTING_KEYS = IMPORT_SETTING_KEYS + MAINTENANCE_SETTING_KEYS
+_JOB_SETTING_KEYS = {
+    "import": IMPORT_SETTING_KEYS,
+    "maintenance": MAINTENANCE_SETTING_KEYS,
+}
 
 
 @dataclass(frozen=True)
@@ -116,124 +133,191 @@ async def run_token_maintenance(
 
 
 class TokenAutomationScheduler:
-    """Run token import and maintenance loops in the application background."""
+    """Schedule token import and maintenance jobs from one background loop."""
 
     def __init__(self) -> None:
         self._stop_event = asyncio.Event()
-        self._tasks: list[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._job_tasks: Dict[str, asyncio.Task] = {}
+        self._next_due: Dict[str, Optional[float]] = {}
+        self._rescheduled_jobs: Set[str] = set()
         self._import_warning: Optional[str] = None
         self._maintenance_warning: Optional[str] = None
 
     async def start(self) -> None:
-        if self._tasks:
+        if self._task is not None:
             return
 
         self._stop_event.clear()
-        self._tasks = [
-            asyncio.create_task(
-                self._auto_import_loop(),
-                name="token-auto-import",
-            ),
-            asyncio.create_task(
-                self._auto_maintenance_loop(),
-                name="token-auto-maintenance",
-            ),
-        ]
+        self._task = asyncio.create_task(
+            self._run_loop(),
+            name="token-automation",
+        )
         logger.info("✅ Token 自动任务调度器已启动")
 
     async def stop(self) -> None:
-        if not self._tasks:
+        if self._task is None:
             return
 
         self._stop_event.set()
-        for task in self._tasks:
+        self._wakeup.set()
+        tasks = [self._task, *self._job_tasks.values()]
+        for task in tasks:
             task.cancel()
 
-        await asyncio.gather(*self._tasks, return_exceptions=True)
-        self._tasks.clear()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._job_tasks.clear()
+        self._next_due.clear()
+        self._rescheduled_jobs.clear()
         self._import_warning = None
         self._maintenance_warning = None
         logger.info("🛑 Token 自动任务调度器已停止")
 
-    async def _auto_import_loop(self) -> None:
-        while not self._stop_event.is_set():
-            wait_seconds = 15
-            try:
-                if settings.TOKEN_AUTO_IMPORT_ENABLED:
-                    wait_seconds = max(int(settings.TOKEN_AUTO_IMPORT_INTERVAL), 30)
-                    source_dir = settings.TOKEN_AUTO_IMPORT_SOURCE_DIR.strip()
-                    if not source_dir:
-                        self._log_import_warning_once(
-                            "已启用自动导入，但未配置导入目录"
-                        )
-                    else:
-                        self._import_warning = None
-                        summary = await run_directory_import(
-                            source_dir,
-                            provider=DEFAULT_TOKEN_PROVIDER,
-                        )
-                        logger.info(
-                            "🔄 自动导入完成: scanned={} imported={} duplicate={} invalid={}",
-                            summary.scanned_files,
-                            summary.imported_count,
-                            summary.duplicate_count,
-                            summary.invalid_json_count + summary.invalid_token_count,
-                        )
-            except asyncio.CancelledError:
-                raise
-            except RuntimeError as exc:
-                logger.info(f"⏭️ 跳过本轮自动导入: {exc}")
-            except (FileNotFoundError, NotADirectoryError) as exc:
-                self._log_import_warning_once(str(exc))
-            except Exception as exc:
-                logger.exception(f"❌ 自动导入 Token 失败: {exc}")
-
-            await self._wait_or_stop(wait_seconds)
-
-    async def _auto_maintenance_loop(self) -> None:
+    def notify_settings_changed(self, changed_keys: Iterable[str]) -> None:
+        """自动任务相关配置变更时，仅让受影响的任务按新配置重新调度。"""
+        changed = set(changed_keys)
+        for job_name, setting_keys in _JOB_SETTING_KEYS.items():
+            if changed.intersection(setting_keys):
+                self._rescheduled_jobs.add(job_name)
+
+        if self._rescheduled_jobs:
+            self._wakeup.set()
+
+    async def _run_loop(self) -> None:
+        """按各任务的到期时间启动独立任务，慢任务不会阻塞其他任务。"""
+        loop = asyncio.get_running_loop()
+        self._next_due = {job_name: loop.time() for job_name in _JOB_SETTING_KEYS}
+
         while not self._stop_event.is_set():
-            wait_seconds = 15
-            try:
-                if settings.TOKEN_AUTO_MAINTENANCE_ENABLED:
-                    wait_seconds = max(
-                        int(settings.TOKEN_AUTO_MAINTENANCE_INTERVAL),
-                        30,
+            # 配置变更的任务立即到期；仍在运行的任务等结束后再重新执行
+            for job_name in list(self._rescheduled_jobs):
+                if job_name not in self._job_tasks:
+                    self._rescheduled_jobs.discard(job_name)
+                    self._next_due[job_name] = loop.time()
+
+            now = loop.time()
+            for job_name, due_at in self._next_due.items():
+                if due_at is not None and due_at <= now:
+                    self._start_job(job_name)
+
+            due_times = [
+                due_at for due_at in self._next_due.values() if due_at is not None
+            ]
+            timeout = (
+                max(min(due_times) - loop.time(), 0.0) if due_times else None
+            )
+            await self._wait_for_wakeup(timeout)
+
+    def _start_job(self, job_name: str) -> None:
+        runner = (
+            self._run_auto_import
+            if job_name == "import"
+            else self._run_auto_maintenance
+        )
+        self._next_due[job_name] = None
+        task = asyncio.create_task(runner(), name=f"token-auto-{job_name}")
+        self._job_tasks[job_name] = task
+        task.add_done_callback(
+            lambda done_task: self._on_job_done(job_name, done_task)
+        )
+
+    def _on_job_done(self, job_name: str, task: asyncio.Task) -> None:
+        self._job_tasks.pop(job_name, None)
+        if task.cancelled() or self._stop_event.is_set():
+            return
+
+        wait_seconds = task.result()
+        self._next_due[job_name] = (
+            None if wait_seconds is None else task.get_loop().time() + wait_seconds
+        )
+        self._wakeup.set()
+
+    async def _run_auto_import(self) -> Optional[int]:
+        """执行一轮自动导入，返回距下一轮的秒数；None 表示等待配置变更。"""
+        wait_seconds: Optional[int] = None
+        try:
+            if settings.TOKEN_AUTO_IMPORT_ENABLED:
+                wait_seconds = max(int(settings.TOKEN_AUTO_IMPORT_INTERVAL), 30)
+                source_dir = settings.TOKEN_AUTO_IMPORT_SOURCE_DIR.strip()
+                if not source_dir:
+                    wait_seconds = None
+                    self._log_import_warning_once(
+                        "已启用自动导入，但未配置导入目录"
                     )
-                    if not self._has_enabled_maintenance_action():
-                        self._log_maintenance_warning_once(
-                            "已启用自动维护，但未选择任何维护动作"
-                        )
-                    else:
-                        self._maintenance_warning = None
-                        summary = await run_token_maintenance(
-                            provider=DEFAULT_TOKEN_PROVIDER,
-                            remove_duplicates=settings.TOKEN_AUTO_REMOVE_DUPLICATES,
-                            run_health_check=settings.TOKEN_AUTO_HEALTH_CHECK,
-                            delete_invalid_tokens=settings.TOKEN_AUTO_DELETE_INVALID,
-                        )
-                        logger.info(
-                            "🧹 自动维护完成: dedupe={} checked={} valid={} guest={} invalid={} deleted={}",
-                            summary.duplicate_removed_count,
-                            summary.checked_count,
-                            summary.valid_count,
-                            summary.guest_count,
-                            summary.invalid_count,
-                            summary.deleted_invalid_count,
-                        )
-            except asyncio.CancelledError:
-                raise
-            except RuntimeError as exc:
-                logger.info(f"⏭️ 跳过本轮自动维护: {exc}")
-            except Exception as exc:
-                logger.exception(f"❌ Token 自动维护失败: {exc}")
-
-            await self._wait_or_stop(wait_seconds)
-
-    async def _wait_or_stop(self, timeout: int) -> None:
+                else:
+                    self._import_warning = None
+                    summary = await run_directory_import(
+                        source_dir,
+                        provider=DEFAULT_TOKEN_PROVIDER,
+                    )
+                    logger.info(
+                        "🔄 自动导入完成: scanned={} imported={} duplicate={} invalid={}",
+                        summary.scanned_files,
+                        summary.imported_count,
+                        summary.duplicate_count,
+                        summary.invalid_json_count + summary.invalid_token_count,
+                    )
+        except asyncio.CancelledError:
+            raise
+        except RuntimeError as exc:
+            logger.info(f"⏭️ 跳过本轮自动导入: {exc}")
+        except (FileNotFoundError, NotADirectoryError) as exc:
+            self._log_import_warning_once(str(exc))
+        except Exception as exc:
+            logger.exception(f"❌ 自动导入 Token 失败: {exc}")
+
+        return wait_seconds
+
+    async def _run_auto_maintenance(self) -> Optional[int]:
+        """执行一轮自动维护，返回距下一轮的秒数；None 表示等待配置变更。"""
+        wait_seconds: Optional[int] = None
+        try:
+            if settings.TOKEN_AUTO_MAINTENANCE_ENABLED:
+                wait_seconds = max(
+                    int(settings.TOKEN_AUTO_MAINTENANCE_INTERVAL),
+                    30,
+                )
+                if not self._has_enabled_maintenance_action():
+                    wait_seconds = None
+                    self._log_maintenance_warning_once(
+                        "已启用自动维护，但未选择任何维护动作"
+                    )
+                else:
+                    self._maintenance_warning = None
+                    summary = await run_token_maintenance(
+                        provider=DEFAULT_TOKEN_PROVIDER,
+                        remove_duplicates=settings.TOKEN_AUTO_REMOVE_DUPLICATES,
+                        run_health_check=settings.TOKEN_AUTO_HEALTH_CHECK,
+                        delete_invalid_tokens=settings.TOKEN_AUTO_DELETE_INVALID,
+                    )
+                    logger.info(
+                        "🧹 自动维护完成: dedupe={} checked={} valid={} guest={} invalid={} deleted={}",
+                        summary.duplicate_removed_count,
+                        summary.checked_count,
+                        summary.valid_count,
+                        summary.guest_count,
+                        summary.invalid_count,
+                        summary.deleted_invalid_count,
+                    )
+        except asyncio.CancelledError:
+            raise
+        except RuntimeError as exc:
+            logger.info(f"⏭️ 跳过本轮自动维护: {exc}")
+        except Exception as exc:
+            logger.exception(f"❌ Token 自动维护失败: {exc}")
+
+        return wait_seconds
+
+    async def _wait_for_wakeup(self, timeout: Optional[float]) -> None:
+        """等待最近的到期时间，或被配置变更、任务结束、停止信号提前唤醒。"""
         try:
-            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
         except asyncio.TimeoutError:
             return
+        finally:
+            self._wakeup.clear()
 
     def _has_enabled_maintenance_action(self) -> bool:
         return any(
@@ -271,6 +355,17 @@ async def start_token_automation_scheduler() -> None:
     await get_token_automation_scheduler().start()
 
 
+def snapshot_token_automation_settings() -> Dict[str, Any]:
+    """记录自动任务相关配置，用于热重载前后比对。"""
+    return {key: getattr(settings, key) for key in AUTOMATION_SETTING_KEYS}
+
+
+def notify_token_automation_settings_changed(changed_keys: Iterable[str]) -> None:
+    if _scheduler is None:
+        return
+    _scheduler.notify_settings_changed(changed_keys)
+
+
 async def stop_token_automation_scheduler() -> None:
     global _scheduler
     if _scheduler is None:
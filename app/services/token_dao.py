@@ -292,6 +292,52 @@ class TokenDAO:
         except Exception as e:
             logger.error(f"❌ 记录失败失败: {e}")
 
+    async def record_usage_batch(
+        self,
+        updates: List[Tuple[int, int, int]],
+    ) -> bool:
+        """
+        批量累加 Token 使用统计（单连接、单次提交）
+
+        Args:
+            updates: (token_id, success_count, failure_count) 列表
+
+        Returns:
+            是否写入成功
+        """
+        if not updates:
+            return True
+
+        try:
+            async with self.get_connection() as conn:
+                await conn.executemany("""
+                    UPDATE token_stats
+                    SET total_requests = total_requests + :success + :failure,
+                        successful_requests = successful_requests + :success,
+                        failed_requests = failed_requests + :failure,
+                        last_success_time = CASE
+                            WHEN :success > 0 THEN CURRENT_TIMESTAMP
+                            ELSE last_success_time
+                        END,
+                        last_failure_time = CASE
+                            WHEN :failure > 0 THEN CURRENT_TIMESTAMP
+                            ELSE last_failure_time
+                        END
+                    WHERE token_id = :token_id
+                """, [
+                    {
+                        "token_id": token_id,
+                        "success": success_count,
+                        "failure": failure_count,
+                    }
+                    for token_id, success_count, failure_count in updates
+                ])
+                await conn.commit()
+                return True
+        except Exception as e:
+            logger.error(f"❌ 批量记录统计失败: {e}")
+            return False
+
     async def get_token_stats(self, token_id: int) -> Optional[Dict]:
         """获取 Token 统计信息"""
         try:
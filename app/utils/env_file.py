@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import re
-from pathlib import Path
 from typing import Mapping
 
 _ENV_KEY_PATTERN = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=")
@@ -29,13 +28,9 @@ def _serialize_env_value(value: object) -> str:
     return text
 
 
-def update_env_file(
-    updates: Mapping[str, object],
-    env_path: str | Path = ".env",
-) -> None:
-    """Update selected keys inside a .env file while preserving other lines."""
-    path = Path(env_path)
-    lines = path.read_text(encoding="utf-8").splitlines() if path.exists() else []
+def render_env_updates(content: str, updates: Mapping[str, object]) -> str:
+    """Apply key updates to .env text in memory while preserving other lines."""
+    lines = content.splitlines()
     remaining_updates = {key: _serialize_env_value(value) for key, value in updates.items()}
 
     for index, line in enumerate(lines):
@@ -55,5 +50,5 @@ def update_env_file(
         for key, value in remaining_updates.items():
             lines.append(f"{key}={value}")
 
-    content = "\n".join(lines).rstrip()
-    path.write_text(f"{content}\n" if content else "", encoding="utf-8")
+    rendered = "\n".join(lines).rstrip()
+    return f"{rendered}\n" if rendered else ""
@@ -15,7 +15,7 @@ import httpx
 from app.core.config import settings
 from app.utils.fe_version import get_latest_fe_version
 from app.utils.logger import logger
-from app.utils.user_agent import get_random_user_agent
+from app.utils.user_agent import BROWSER_CHOICES, get_random_user_agent
 
 AUTH_URL = "https://chat.z.ai/api/v1/auths/"
 CHATS_URL = "https://chat.z.ai/api/v1/chats/"
@@ -25,6 +25,7 @@ GUEST_SESSION_TTL_SECONDS = 480
 GUEST_SESSION_TTL_JITTER_SECONDS = 60
 GUEST_SESSION_MIN_TTL_SECONDS = 180
 GUEST_POOL_MAINTENANCE_INTERVAL_SECONDS = 30
+GUEST_POOL_SHUTDOWN_GRACE_SECONDS = 5
 GUEST_CLEANUP_PARALLELISM = 4
 CAPACITY_FILL_ATTEMPT_MULTIPLIER = 3
 CAPACITY_FILL_MIN_ATTEMPTS = 3
@@ -72,16 +73,7 @@ def _build_async_client(read_timeout: float = 30.0) -> httpx.AsyncClient:
 
 def _build_dynamic_headers(chat_id: str = "") -> Dict[str, str]:
     """生成匿名访客鉴权所需浏览器请求头。"""
-    browser_choices = [
-        "chrome",
-        "chrome",
-        "chrome",
-        "edge",
-        "edge",
-        "firefox",
-        "safari",
-    ]
-    browser_type = random.choice(browser_choices)
+    browser_type = random.choice(BROWSER_CHOICES)
     user_agent = get_random_user_agent(browser_type)
     fe_version = get_latest_fe_version()
 
@@ -192,6 +184,7 @@ class GuestSessionPool:
         self._lock = Lock()
         self._sessions: Dict[str, GuestSession] = {}
         self._maintenance_task: Optional[asyncio.Task] = None
+        self._stop_event = asyncio.Event()
         self._http_client: Optional[httpx.AsyncClient] = None
         self._client_lock = asyncio.Lock()
         self._capacity_lock = asyncio.Lock()
@@ -432,11 +425,21 @@ class GuestSessionPool:
                     f"missing={remaining}, current={len(self._list_valid_sessions())}"
                 )
 
+    async def _wait_for_next_maintenance(self) -> bool:
+        """等待下一轮维护；收到停止信号时立即返回 False。"""
+        try:
+            await asyncio.wait_for(
+                self._stop_event.wait(),
+                timeout=self._maintenance_interval,
+            )
+        except asyncio.TimeoutError:
+            return True
+        return False
+
     async def _maintenance_loop(self):
         """后台维护：回收过期/失效会话，并补齐池容量。"""
-        while True:
+        while await self._wait_for_next_maintenance():
             try:
-                await asyncio.sleep(self._maintenance_interval)
                 retired_sessions = self._pop_retired_sessions()
                 await self._delete_sessions_concurrently(retired_sessions)
 
@@ -451,6 +454,7 @@ class GuestSessionPool:
         if self._maintenance_task:
             return
 
+        self._stop_event.clear()
         await self._ensure_capacity()
         created = len(self._list_valid_sessions())
 
@@ -468,10 +472,14 @@ class GuestSessionPool:
     async def close(self):
         """关闭匿名会话池。"""
         if self._maintenance_task:
-            self._maintenance_task.cancel()
+            # 先发停止信号让空闲循环立即退出，正在进行的维护有短暂宽限期收尾。
+            self._stop_event.set()
             try:
-                await self._maintenance_task
-            except asyncio.CancelledError:
+                await asyncio.wait_for(
+                    self._maintenance_task,
+                    timeout=GUEST_POOL_SHUTDOWN_GRACE_SECONDS,
+                )
+            except (asyncio.CancelledError, asyncio.TimeoutError):
                 pass
             self._maintenance_task = None
 
@@ -585,6 +593,14 @@ class GuestSessionPool:
 
         await self._delete_sessions_concurrently(idle_sessions)
 
+    def count_valid_sessions(self) -> int:
+        """统计当前可用的匿名会话数量（不构建完整状态快照）。"""
+        with self._lock:
+            return sum(
+                1 for session in self._sessions.values()
+                if self._is_session_usable(session)
+            )
+
     def get_pool_status(self) -> Dict[str, int]:
         """获取匿名会话池状态。"""
         with self._lock:
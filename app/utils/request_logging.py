@@ -5,16 +5,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
-from typing import Any, AsyncGenerator, Dict, Optional
+from datetime import datetime
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
-from app.services.request_log_dao import get_request_log_dao
+from app.services.request_log_dao import format_sqlite_datetime, get_request_log_dao
 from app.utils.logger import get_logger
 from app.utils.request_source import RequestSourceInfo
 
 logger = get_logger()
 
+REQUEST_LOG_FLUSH_INTERVAL_SECONDS = 0.5
+REQUEST_LOG_MAX_BATCH_SIZE = 200
+REQUEST_LOG_MAX_PENDING = 5000
+REQUEST_LOG_TRIM_TO = 4000
+
 
 def _coerce_int(value: Any) -> int:
     try:
@@ -132,6 +139,104 @@ def extract_claude_usage(response: Dict[str, Any]) -> Dict[str, int]:
     }
 
 
+class RequestLogBuffer:
+    """合并请求日志写入，按批次落库以减少 SQLite 连接与提交次数。"""
+
+    def __init__(
+        self,
+        flush_interval: float = REQUEST_LOG_FLUSH_INTERVAL_SECONDS,
+        max_batch_size: int = REQUEST_LOG_MAX_BATCH_SIZE,
+        max_pending: int = REQUEST_LOG_MAX_PENDING,
+        trim_to: int = REQUEST_LOG_TRIM_TO,
+    ):
+        self.flush_interval = flush_interval
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_pending = max(self.max_batch_size, max_pending)
+        self.trim_to = min(max(0, trim_to), self.max_pending)
+        self._pending: List[Dict[str, Any]] = []
+        self._batch_ready = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put(self, entry: Dict[str, Any]) -> None:
+        """登记一条日志；无刷新任务时调度一次延迟刷新，满批时立即刷新。"""
+        self._pending.append(entry)
+
+        # 数据库写入跟不上时限制积压量，一次丢弃一段最旧的日志，避免内存无限增长
+        if len(self._pending) > self.max_pending:
+            dropped = len(self._pending) - self.trim_to
+            del self._pending[:dropped]
+            logger.warning(f"⚠️ 请求日志积压过多，已丢弃最旧的 {dropped} 条")
+
+        if len(self._pending) >= self.max_batch_size:
+            self._batch_ready.set()
+
+        # 刷新任务在写库完成前一直保留，写库期间入队的日志由同一任务继续写入
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_soon())
+
+    async def _flush_soon(self) -> None:
+        try:
+            try:
+                await asyncio.wait_for(
+                    self._batch_ready.wait(),
+                    timeout=self.flush_interval,
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+            await self.flush()
+        finally:
+            self._flush_task = None
+
+    async def flush(self) -> None:
+        """将当前积压的日志分批写入数据库；同一时间只有一个写入者。"""
+        async with self._flush_lock:
+            while self._pending:
+                batch = self._pending[: self.max_batch_size]
+                del self._pending[: self.max_batch_size]
+
+                try:
+                    await get_request_log_dao().add_logs(batch)
+                except Exception as exc:
+                    logger.error(f"批量写入请求日志失败: {exc}")
+
+    async def close(self) -> None:
+        """唤醒并等待进行中的刷新，再写入剩余日志。"""
+        self._closed = True
+        task = self._flush_task
+        if task is not None:
+            self._batch_ready.set()
+            await asyncio.gather(task, return_exceptions=True)
+
+        await self.flush()
+
+
+_request_log_buffer: Optional[RequestLogBuffer] = None
+
+
+def get_request_log_buffer() -> RequestLogBuffer:
+    """获取全局请求日志写入缓冲。"""
+    global _request_log_buffer
+    if _request_log_buffer is None:
+        _request_log_buffer = RequestLogBuffer()
+    return _request_log_buffer
+
+
+async def close_request_log_buffer() -> None:
+    """服务关闭时写入尚未落库的请求日志；之后的日志改为直接写库。"""
+    await get_request_log_buffer().close()
+
+
 async def write_request_log(
     *,
     provider: str,
@@ -148,28 +253,38 @@ async def write_request_log(
     total_tokens: Optional[int] = None,
     error_message: Optional[str] = None,
 ) -> None:
-    """Persist a request log entry without breaking request handling."""
+    """Queue a request log entry for batched persistence.
+
+    Failures are logged and never propagate into request handling.
+    """
     duration = max(0.0, time.perf_counter() - started_at)
     try:
-        dao = get_request_log_dao()
-        await dao.add_log(
-            provider=provider,
-            endpoint=source_info.endpoint,
-            source=source_info.source,
-            protocol=source_info.protocol,
-            client_name=source_info.client_name,
-            model=model,
-            status_code=status_code,
-            success=success,
-            duration=duration,
-            first_token_time=first_token_time,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            cache_creation_tokens=cache_creation_tokens,
-            cache_read_tokens=cache_read_tokens,
-            total_tokens=total_tokens,
-            error_message=error_message,
-        )
+        entry = {
+            "timestamp": format_sqlite_datetime(datetime.utcnow()),
+            "provider": provider,
+            "endpoint": source_info.endpoint,
+            "source": source_info.source,
+            "protocol": source_info.protocol,
+            "client_name": source_info.client_name,
+            "model": model,
+            "status_code": status_code,
+            "success": success,
+            "duration": duration,
+            "first_token_time": first_token_time,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cache_creation_tokens": cache_creation_tokens,
+            "cache_read_tokens": cache_read_tokens,
+            "total_tokens": total_tokens,
+            "error_message": error_message,
+        }
+
+        buffer = get_request_log_buffer()
+        if buffer.closed:
+            # 缓冲已随服务关闭停止刷新，关闭后才结束的请求直接落库
+            await get_request_log_dao().add_logs([entry])
+        else:
+            buffer.put(entry)
     except Exception as exc:
         logger.error(f"写入请求日志失败: {exc}")
 
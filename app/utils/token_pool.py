@@ -89,6 +89,11 @@ class ZAITokenValidator:
     """Z.AI Token 验证器（使用官方认证接口）"""
 
     AUTH_URL = "https://chat.z.ai/api/v1/auths/"
+    REQUEST_TIMEOUT = 15.0
+
+    # 批量校验时复用同一个客户端，避免每个 Token 都重新建连和握手
+    _http_client: Optional[httpx.AsyncClient] = None
+    _client_lock: Optional[asyncio.Lock] = None
 
     @staticmethod
     def get_headers(token: str) -> Dict[str, str]:
@@ -110,6 +115,28 @@ class ZAITokenValidator:
             "sec-ch-ua-platform": '"Windows"'
         }
 
+    @classmethod
+    async def _get_http_client(cls) -> httpx.AsyncClient:
+        """获取可复用的 HTTP 客户端。"""
+        if cls._http_client is not None:
+            return cls._http_client
+
+        if cls._client_lock is None:
+            cls._client_lock = asyncio.Lock()
+        async with cls._client_lock:
+            if cls._http_client is None:
+                cls._http_client = httpx.AsyncClient(timeout=cls.REQUEST_TIMEOUT)
+        return cls._http_client
+
+    @classmethod
+    async def close_http_client(cls):
+        """关闭可复用的 HTTP 客户端。"""
+        client = cls._http_client
+        cls._http_client = None
+
+        if client is not None:
+            await client.aclose()
+
     @classmethod
     async def validate_token(cls, token: str) -> Tuple[str, bool, Optional[str]]:
         """
@@ -125,14 +152,14 @@ class ZAITokenValidator:
             - error_message: 失败原因（仅在 is_valid=False 时有值）
         """
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(
-                    cls.AUTH_URL,
-                    headers=cls.get_headers(token)
-                )
+            client = await cls._get_http_client()
+            response = await client.get(
+                cls.AUTH_URL,
+                headers=cls.get_headers(token)
+            )
 
-                # 解析响应
-                return cls._parse_auth_response(response)
+            # 解析响应
+            return cls._parse_auth_response(response)
 
         except httpx.TimeoutException:
             return ("unknown", False, "请求超时")
@@ -212,6 +239,10 @@ class TokenPool:
         self.recovery_timeout = recovery_timeout
         self._lock = Lock()
         self._current_index = 0
+        # 数据库同步合并：并发请求只需等待一次在其请求之后开始的同步
+        self._sync_lock = asyncio.Lock()
+        self._sync_requested: Dict[str, int] = {}
+        self._sync_completed: Dict[str, int] = {}
 
         # 初始化 Token 状态（内存中）
         self.token_statuses: Dict[str, TokenStatus] = {}
@@ -387,6 +418,14 @@ class TokenPool:
         """获取 Token 的数据库 ID"""
         return self.token_id_map.get(token)
 
+    def count_available_tokens(self) -> int:
+        """统计当前可用的认证用户 Token 数量（不构建完整状态快照）。"""
+        with self._lock:
+            return sum(
+                1 for status in self.token_statuses.values()
+                if status.is_available and status.token_type == "user"
+            )
+
     def get_pool_status(self) -> Dict:
         """获取 Token 池状态信息"""
         with self._lock:
@@ -511,7 +550,22 @@ class TokenPool:
             - 如果数据库中 Token 被禁用，则从池中移除
             - 如果数据库中有新增的启用 Token，则添加到池中
             - 保留现有 Token 的运行时统计（请求数、成功率等）
+            - 并发调用会被合并：若排队期间已有一次在本次请求之后开始的
+              同步完成，则直接复用其结果，不再重复读库
         """
+        request_id = self._sync_requested.get(provider, 0) + 1
+        self._sync_requested[provider] = request_id
+
+        async with self._sync_lock:
+            if self._sync_completed.get(provider, 0) >= request_id:
+                return
+
+            started_id = self._sync_requested[provider]
+            await self._sync_from_database(provider)
+            self._sync_completed[provider] = started_id
+
+    async def _sync_from_database(self, provider: str):
+        """执行一次实际的数据库同步。"""
         from app.services.token_dao import get_token_dao
 
         dao = get_token_dao()
@@ -670,13 +724,21 @@ async def sync_token_stats_to_db():
                     )
                 )
 
-    for token, token_id, pending_success, pending_failure in pending_updates:
-        for _ in range(pending_success):
-            await dao.record_success(token_id)
-        for _ in range(pending_failure):
-            await dao.record_failure(token_id)
+    if not pending_updates:
+        return
 
-        with pool._lock:
+    # 所有 Token 的增量合并为一次批量 UPDATE，避免按请求次数逐条提交
+    synced = await dao.record_usage_batch(
+        [
+            (token_id, pending_success, pending_failure)
+            for _, token_id, pending_success, pending_failure in pending_updates
+        ]
+    )
+    if not synced:
+        return
+
+    with pool._lock:
+        for token, _, pending_success, pending_failure in pending_updates:
             if token in pool.token_statuses:
                 status = pool.token_statuses[token]
                 status.db_synced_successful_requests += pending_success
@@ -10,6 +10,9 @@ import random
 from typing import Dict, Optional
 from fake_useragent import UserAgent
 
+# 随机浏览器类型的加权候选（偏向 Chrome 和 Edge），导入时构建一次
+BROWSER_CHOICES = ("chrome", "chrome", "chrome", "edge", "edge", "firefox", "safari")
+
 # 全局 UserAgent 实例（单例模式）
 _user_agent_instance: Optional[UserAgent] = None
 
@@ -37,8 +40,7 @@ def get_random_user_agent(browser_type: Optional[str] = None) -> str:
 
     # 如果没有指定浏览器类型，随机选择一个（偏向 Chrome 和 Edge）
     if browser_type is None:
-        browser_choices = ["chrome", "chrome", "chrome", "edge", "edge", "firefox", "safari"]
-        browser_type = random.choice(browser_choices)
+        browser_type = random.choice(BROWSER_CHOICES)
 
     # 根据浏览器类型获取用户代理
     if browser_type == "chrome":
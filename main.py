@@ -95,6 +95,14 @@ async def lifespan(app: FastAPI):
 
     await stop_token_automation_scheduler()
 
+    from app.utils.request_logging import close_request_log_buffer
+
+    await close_request_log_buffer()
+
+    from app.utils.token_pool import ZAITokenValidator
+
+    await ZAITokenValidator.close_http_client()
+
     if settings.ANONYMOUS_MODE:
         from app.utils.guest_session_pool import close_guest_session_pool
 
@@ -1,3 +1,5 @@
+import asyncio
+import os
 from types import SimpleNamespace
 from urllib.parse import urlencode
 
@@ -8,6 +10,7 @@ from starlette.requests import Request
 from app.admin import api as admin_api
 from app.admin.config_manager import (
     CONFIG_FIELD_SPECS,
+    _apply_env_change,
     build_config_page_data,
     save_form_config,
     save_source_config,
@@ -102,6 +105,39 @@ async def test_build_config_page_data_includes_sections_and_override_status(
     assert field_map["ADMIN_PASSWORD"]["sensitive"] is True
 
 
+def test_build_config_page_data_detects_overrides_with_dotenv_semantics(
+    tmp_path,
+):
+    env_path = tmp_path / ".env"
+    env_path.write_text(
+        "# LISTEN_PORT=9000\n"
+        "export SERVICE_NAME=exported\n"
+        "  ROOT_PATH = /edge\n"
+        'ADMIN_PASSWORD="abc\nLISTEN_PORT=9000\nxyz"\n'
+        "DEBUG_LOGGING\n"
+        "CUSTOM_FLAG=keep\n",
+        encoding="utf-8",
+    )
+
+    page_data = build_config_page_data(
+        settings_obj=SimpleNamespace(),
+        env_path=env_path,
+        env_example_path=tmp_path / ".env.example",
+    )
+    field_map = {
+        field["key"]: field
+        for section in page_data["sections"]
+        for field in section["fields"]
+    }
+
+    assert page_data["overview"]["overridden_fields"] == 4
+    assert field_map["SERVICE_NAME"]["source_label"] == ".env"
+    assert field_map["ROOT_PATH"]["source_label"] == ".env"
+    assert field_map["ADMIN_PASSWORD"]["source_label"] == ".env"
+    assert field_map["DEBUG_LOGGING"]["source_label"] == ".env"
+    assert field_map["LISTEN_PORT"]["source_label"] == "默认值"
+
+
 @pytest.mark.asyncio
 async def test_save_form_config_preserves_unmanaged_lines_and_updates_fields(
     tmp_path,
@@ -167,6 +203,59 @@ async def test_save_source_config_rolls_back_file_when_reload_fails(tmp_path):
     assert env_path.read_text(encoding="utf-8") == "SERVICE_NAME=old-service\n"
 
 
+@pytest.mark.asyncio
+async def test_save_source_config_skips_write_when_content_unchanged(tmp_path):
+    env_path = tmp_path / ".env"
+    env_path.write_text("SERVICE_NAME=same-service\n", encoding="utf-8")
+    os.utime(env_path, ns=(1_000_000_000, 1_000_000_000))
+    reload_calls = 0
+
+    async def reload_callback():
+        nonlocal reload_calls
+        reload_calls += 1
+
+    await save_source_config(
+        "SERVICE_NAME=same-service\n",
+        reload_callback=reload_callback,
+        env_path=env_path,
+    )
+
+    assert reload_calls == 1
+    assert env_path.stat().st_mtime_ns == 1_000_000_000
+
+
+@pytest.mark.asyncio
+async def test_apply_env_change_serializes_concurrent_saves(tmp_path):
+    env_path = tmp_path / ".env"
+    env_path.write_text("SERVICE_NAME=base\n", encoding="utf-8")
+
+    async def reload_callback():
+        await asyncio.sleep(0.01)
+
+    def append_line(line: str):
+        def _render(previous_content: str) -> str:
+            return f"{previous_content}{line}\n"
+
+        return _render
+
+    await asyncio.gather(
+        _apply_env_change(
+            append_line("LISTEN_PORT=8081"),
+            reload_callback=reload_callback,
+            env_path=env_path,
+        ),
+        _apply_env_change(
+            append_line("DEBUG_LOGGING=true"),
+            reload_callback=reload_callback,
+            env_path=env_path,
+        ),
+    )
+
+    assert env_path.read_text(encoding="utf-8") == (
+        "SERVICE_NAME=base\nLISTEN_PORT=8081\nDEBUG_LOGGING=true\n"
+    )
+
+
 @pytest.mark.asyncio
 async def test_save_config_endpoint_returns_refresh_trigger(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
@@ -229,3 +318,39 @@ def test_config_template_compiles():
     template = env.get_template("config.html")
 
     assert template is not None
+
+
+@pytest.mark.asyncio
+async def test_reload_settings_skips_automation_wakeup_for_unrelated_keys(
+    tmp_path,
+    monkeypatch,
+):
+    import dotenv
+
+    from app.core.config import settings
+    from app.services import token_automation as automation_module
+
+    notified: list[list[str]] = []
+    original_values = settings.model_dump()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(dotenv, "load_dotenv", lambda **_: None)
+    monkeypatch.setattr(
+        automation_module,
+        "notify_token_automation_settings_changed",
+        lambda changed_keys: notified.append(list(changed_keys)),
+    )
+
+    try:
+        monkeypatch.setenv("SERVICE_NAME", "renamed-service")
+        await admin_api.reload_settings()
+        assert notified == []
+
+        monkeypatch.setenv(
+            "TOKEN_AUTO_IMPORT_INTERVAL",
+            str(settings.TOKEN_AUTO_IMPORT_INTERVAL + 60),
+        )
+        await admin_api.reload_settings()
+        assert notified == [["TOKEN_AUTO_IMPORT_INTERVAL"]]
+    finally:
+        for key, value in original_values.items():
+            setattr(settings, key, value)
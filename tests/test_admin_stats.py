@@ -1,7 +1,9 @@
+import asyncio
 import json
 from datetime import datetime
 from urllib.parse import urlencode
 
+import httpx
 import pytest
 from starlette.requests import Request
 
@@ -486,6 +488,118 @@ async def test_token_pool_realtime_usage_stats_sync_to_db(tmp_path, monkeypatch)
     assert stats_after_sync["failed_requests"] == 1
 
 
+@pytest.mark.asyncio
+async def test_sync_token_stats_to_db_writes_pending_counts_in_one_batch(
+    tmp_path,
+    monkeypatch,
+):
+    dao = TokenDAO(str(tmp_path / "token_batch.db"))
+    await dao.init_database()
+    token_id = await dao.add_token("zai", "token-batch", validate=False)
+    assert token_id is not None
+
+    pool = TokenPool([(token_id, "token-batch", "user")])
+    status = pool.token_statuses["token-batch"]
+    status.total_requests = 5
+    status.successful_requests = 3
+
+    monkeypatch.setattr(token_pool_module, "_token_pool", pool)
+    monkeypatch.setattr(token_dao_module, "_token_dao", dao)
+
+    await sync_token_stats_to_db()
+    await sync_token_stats_to_db()
+
+    stats = await dao.get_token_stats(token_id)
+    assert stats is not None
+    assert stats["total_requests"] == 5
+    assert stats["successful_requests"] == 3
+    assert stats["failed_requests"] == 2
+    assert stats["last_success_time"] is not None
+    assert stats["last_failure_time"] is not None
+
+
 def test_format_uptime_formats_seconds_minutes_and_hours():
     assert format_uptime(59) == "59秒"
     assert format_uptime(3661) == "1小时 1分钟 1秒"
+
+
+def test_read_log_tail_returns_last_lines_across_block_boundaries(
+    tmp_path,
+    monkeypatch,
+):
+    log_file = tmp_path / "app.log"
+    log_file.write_text(
+        "".join(f"line-{index} 日志\n" for index in range(200)),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(admin_api, "_LIVE_LOG_READ_BLOCK_SIZE", 37)
+
+    lines = admin_api._read_log_tail(str(log_file), 50)
+
+    assert len(lines) == 50
+    assert lines[0] == "line-150 日志"
+    assert lines[-1] == "line-199 日志"
+
+
+@pytest.mark.asyncio
+async def test_token_validator_reuses_shared_http_client(monkeypatch):
+    seen_tokens = []
+
+    def handler(request):
+        seen_tokens.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"role": "user"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(token_pool_module.ZAITokenValidator, "_http_client", client)
+
+    first = await token_pool_module.ZAITokenValidator.validate_token("token-a")
+    second = await token_pool_module.ZAITokenValidator.validate_token("token-b")
+
+    assert first == ("user", True, None)
+    assert second == ("user", True, None)
+    assert seen_tokens == ["Bearer token-a", "Bearer token-b"]
+    assert token_pool_module.ZAITokenValidator._http_client is client
+
+    await token_pool_module.ZAITokenValidator.close_http_client()
+
+    assert token_pool_module.ZAITokenValidator._http_client is None
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_token_pool_coalesces_concurrent_database_syncs(monkeypatch):
+    load_calls = 0
+
+    class SlowDAO:
+        async def get_tokens_by_provider(self, provider, enabled_only=True):
+            nonlocal load_calls
+            load_calls += 1
+            await asyncio.sleep(0.02)
+            return [{"id": 1, "token": "token-sync", "token_type": "user"}]
+
+    monkeypatch.setattr(token_dao_module, "_token_dao", SlowDAO())
+    pool = TokenPool([])
+
+    await asyncio.gather(*(pool.sync_from_database("zai") for _ in range(5)))
+
+    assert load_calls == 2
+    assert set(pool.token_statuses) == {"token-sync"}
+
+
+@pytest.mark.asyncio
+async def test_live_logs_reads_latest_log_file_off_event_loop(tmp_path, monkeypatch):
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    (log_dir / "2026-01-01.log").write_text("old entry\n", encoding="utf-8")
+    (log_dir / "2026-01-02.log").write_text(
+        "12:00:00 | INFO     | <started>\n",
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(tmp_path)
+
+    response = await admin_api.get_live_logs()
+    body = response.body.decode()
+
+    assert "&lt;started&gt;" in body
+    assert "text-blue-400" in body
+    assert "old entry" not in body
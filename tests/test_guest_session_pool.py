@@ -95,3 +95,35 @@ async def test_acquire_skips_duplicate_excluded_session_without_overwriting_pool
     assert acquired.active_requests == 1
     assert set(pool._sessions) == {"user-1", "user-2"}
     assert pool._sessions["user-1"].token == "token-seed"
+
+
+@pytest.mark.asyncio
+async def test_close_wakes_idle_maintenance_loop_without_waiting_interval(
+    monkeypatch,
+):
+    pool = GuestSessionPool(pool_size=1)
+    pool._maintenance_interval = 3600
+    pool._sessions["user-1"] = _make_session("user-1", "seed")
+
+    monkeypatch.setattr(pool, "_delete_all_chats", AsyncMock(return_value=True))
+    monkeypatch.setattr(pool, "_close_http_client", AsyncMock(return_value=None))
+
+    await pool.initialize()
+    maintenance_task = pool._maintenance_task
+
+    await asyncio.wait_for(pool.close(), timeout=0.5)
+
+    assert maintenance_task.done()
+    assert not maintenance_task.cancelled()
+    assert pool._maintenance_task is None
+
+
+def test_count_valid_sessions_skips_invalid_sessions():
+    pool = GuestSessionPool(pool_size=3)
+    usable = _make_session("user-1", "usable")
+    invalid = _make_session("user-2", "invalid")
+    invalid.valid = False
+    pool._sessions = {usable.user_id: usable, invalid.user_id: invalid}
+
+    assert pool.count_valid_sessions() == 1
+    assert pool.count_valid_sessions() == pool.get_pool_status()["valid_sessions"]
@@ -1,7 +1,17 @@
+import asyncio
+import time
+
+import pytest
+
+from app.services.request_log_dao import RequestLogDAO
+from app.utils import request_logging as request_logging_module
 from app.utils.request_logging import (
+    RequestLogBuffer,
     extract_claude_usage,
     extract_openai_usage,
+    write_request_log,
 )
+from app.utils.request_source import RequestSourceInfo
 
 
 def test_extract_openai_usage_supports_cached_prompt_details():
@@ -46,3 +56,178 @@ def test_extract_claude_usage_supports_cache_token_fields():
         "cache_read_tokens": 48,
         "total_tokens": 392,
     }
+
+
+@pytest.mark.asyncio
+async def test_request_log_buffer_batches_entries_into_single_insert(
+    tmp_path,
+    monkeypatch,
+):
+    dao = RequestLogDAO(str(tmp_path / "request_logs.db"))
+    batches = []
+    original_add_logs = dao.add_logs
+
+    async def tracking_add_logs(entries):
+        batches.append(len(entries))
+        return await original_add_logs(entries)
+
+    monkeypatch.setattr(dao, "add_logs", tracking_add_logs)
+    monkeypatch.setattr(request_logging_module, "get_request_log_dao", lambda: dao)
+    buffer = RequestLogBuffer(flush_interval=0.05)
+    monkeypatch.setattr(request_logging_module, "_request_log_buffer", buffer)
+
+    source_info = RequestSourceInfo(
+        source="pytest",
+        protocol="openai",
+        client_name="pytest",
+        endpoint="/v1/chat/completions",
+        user_agent="pytest",
+    )
+    for _ in range(3):
+        await write_request_log(
+            provider="zai",
+            model="glm-5",
+            source_info=source_info,
+            success=True,
+            started_at=time.perf_counter(),
+            input_tokens=10,
+            output_tokens=5,
+        )
+
+    assert await dao.count_logs() == 0
+
+    await asyncio.sleep(0.2)
+
+    assert batches == [3]
+    assert buffer.pending_count == 0
+    logs = await dao.get_recent_logs()
+    assert len(logs) == 3
+    assert all(log["total_tokens"] == 15 for log in logs)
+
+
+@pytest.mark.asyncio
+async def test_request_log_buffer_drops_oldest_entries_when_backlog_exceeds_limit(
+    monkeypatch,
+):
+    buffer = RequestLogBuffer(
+        flush_interval=60,
+        max_batch_size=2,
+        max_pending=5,
+        trim_to=3,
+    )
+    monkeypatch.setattr(request_logging_module.logger, "warning", lambda *_: None)
+
+    for index in range(6):
+        buffer.put({"index": index})
+
+    assert buffer.pending_count == 3
+    assert [entry["index"] for entry in buffer._pending] == [3, 4, 5]
+
+    buffer._flush_task.cancel()
+    await asyncio.gather(buffer._flush_task, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_write_request_log_persists_directly_after_buffer_closed(
+    tmp_path,
+    monkeypatch,
+):
+    dao = RequestLogDAO(str(tmp_path / "request_logs.db"))
+    monkeypatch.setattr(request_logging_module, "get_request_log_dao", lambda: dao)
+    buffer = RequestLogBuffer(flush_interval=60)
+    monkeypatch.setattr(request_logging_module, "_request_log_buffer", buffer)
+
+    await request_logging_module.close_request_log_buffer()
+
+    await write_request_log(
+        provider="zai",
+        model="glm-5",
+        source_info=RequestSourceInfo(
+            source="pytest",
+            protocol="openai",
+            client_name="pytest",
+            endpoint="/v1/chat/completions",
+            user_agent="pytest",
+        ),
+        success=True,
+        started_at=time.perf_counter(),
+    )
+
+    assert request_logging_module.get_request_log_buffer() is buffer
+    assert buffer.pending_count == 0
+    assert buffer._flush_task is None
+    assert await dao.count_logs() == 1
+
+
+class _BlockingRequestLogDAO:
+    """写库时阻塞直到放行，用于模拟慢速 SQLite。"""
+
+    def __init__(self):
+        self.batches: list[list[int]] = []
+        self.active_writes = 0
+        self.max_active_writes = 0
+        self.write_started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def add_logs(self, entries):
+        self.active_writes += 1
+        self.max_active_writes = max(self.max_active_writes, self.active_writes)
+        self.write_started.set()
+        try:
+            await self.release.wait()
+            self.batches.append([entry["index"] for entry in entries])
+            return len(entries)
+        finally:
+            self.active_writes -= 1
+
+
+@pytest.mark.asyncio
+async def test_request_log_buffer_close_waits_for_in_flight_flush(monkeypatch):
+    dao = _BlockingRequestLogDAO()
+    monkeypatch.setattr(request_logging_module, "get_request_log_dao", lambda: dao)
+    buffer = RequestLogBuffer(flush_interval=60, max_batch_size=200)
+
+    for index in range(200):
+        buffer.put({"index": index})
+    await asyncio.wait_for(dao.write_started.wait(), timeout=1)
+
+    close_task = asyncio.create_task(buffer.close())
+    await asyncio.sleep(0)
+    assert not close_task.done()
+
+    dao.release.set()
+    await asyncio.wait_for(close_task, timeout=1)
+
+    assert [len(batch) for batch in dao.batches] == [200]
+    assert buffer.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_request_log_buffer_caps_backlog_while_slow_write_is_in_flight(
+    monkeypatch,
+):
+    dao = _BlockingRequestLogDAO()
+    monkeypatch.setattr(request_logging_module, "get_request_log_dao", lambda: dao)
+    monkeypatch.setattr(request_logging_module.logger, "warning", lambda *_: None)
+    buffer = RequestLogBuffer(
+        flush_interval=60,
+        max_batch_size=2,
+        max_pending=5,
+        trim_to=3,
+    )
+
+    buffer.put({"index": 0})
+    buffer.put({"index": 1})
+    await asyncio.wait_for(dao.write_started.wait(), timeout=1)
+
+    for index in range(2, 8):
+        buffer.put({"index": index})
+
+    assert buffer.pending_count == 3
+    assert [entry["index"] for entry in buffer._pending] == [5, 6, 7]
+
+    dao.release.set()
+    await asyncio.wait_for(buffer.close(), timeout=1)
+
+    assert dao.batches == [[0, 1], [5, 6], [7]]
+    assert dao.max_active_writes == 1
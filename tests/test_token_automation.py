@@ -1,5 +1,8 @@
+import asyncio
+
 import pytest
 
+from app.services import token_automation as automation_module
 from app.services.token_automation import run_token_maintenance
 from app.services.token_dao import TokenDAO
 from app.utils.token_pool import ZAITokenValidator
@@ -49,3 +52,175 @@ async def test_run_token_maintenance_deletes_invalid_tokens_after_validation(
     remaining_tokens = await dao.get_tokens_by_provider("zai", enabled_only=False)
     assert [token["token"] for token in remaining_tokens] == ["token-valid"]
     assert remaining_tokens[0]["token_type"] == "user"
+
+
+class _RecordingImport:
+    """记录调用的 run_directory_import 替身，每次执行后触发事件。"""
+
+    def __init__(self):
+        self.calls: list[str] = []
+        self.called = asyncio.Event()
+
+    async def __call__(self, source_dir, *, provider):
+        self.calls.append(source_dir)
+        self.called.set()
+        return automation_module.TokenImportSummary(
+            source_dir=source_dir,
+            scanned_files=0,
+            imported_count=0,
+            duplicate_count=0,
+            invalid_json_count=0,
+            missing_token_count=0,
+            invalid_token_count=0,
+        )
+
+    async def wait_for_call(self):
+        await asyncio.wait_for(self.called.wait(), timeout=1)
+        self.called.clear()
+
+
+@pytest.fixture
+def fake_import(monkeypatch):
+    recorder = _RecordingImport()
+    monkeypatch.setattr(automation_module, "run_directory_import", recorder)
+    return recorder
+
+
+async def _wait_until(predicate, timeout: float = 1.0) -> None:
+    async def _poll():
+        while not predicate():
+            await asyncio.sleep(0)
+
+    await asyncio.wait_for(_poll(), timeout=timeout)
+
+
+def _scheduler_is_idle(scheduler) -> bool:
+    return (
+        bool(scheduler._next_due)
+        and not scheduler._job_tasks
+        and not scheduler._rescheduled_jobs
+        and not scheduler._wakeup.is_set()
+    )
+
+
+def _enable_import(monkeypatch) -> None:
+    monkeypatch.setattr(
+        automation_module.settings, "TOKEN_AUTO_IMPORT_ENABLED", True
+    )
+    monkeypatch.setattr(
+        automation_module.settings, "TOKEN_AUTO_IMPORT_SOURCE_DIR", "/srv/tokens"
+    )
+
+
+@pytest.mark.asyncio
+async def test_scheduler_idles_until_settings_change_wakes_import_loop(
+    monkeypatch,
+    fake_import,
+):
+    monkeypatch.setattr(
+        automation_module.settings, "TOKEN_AUTO_IMPORT_ENABLED", False
+    )
+    monkeypatch.setattr(
+        automation_module.settings, "TOKEN_AUTO_MAINTENANCE_ENABLED", False
+    )
+
+    scheduler = automation_module.TokenAutomationScheduler()
+    await scheduler.start()
+    try:
+        await _wait_until(lambda: _scheduler_is_idle(scheduler))
+        assert fake_import.calls == []
+        assert scheduler._next_due == {"import": None, "maintenance": None}
+
+        _enable_import(monkeypatch)
+        scheduler.notify_settings_changed(
+            ["TOKEN_AUTO_IMPORT_ENABLED", "TOKEN_AUTO_IMPORT_SOURCE_DIR"]
+        )
+        await fake_import.wait_for_call()
+
+        assert fake_import.calls == ["/srv/tokens"]
+    finally:
+        await asyncio.wait_for(scheduler.stop(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_runs_due_import_while_maintenance_is_still_running(
+    monkeypatch,
+    fake_import,
+):
+    monkeypatch.setattr(
+        automation_module.settings, "TOKEN_AUTO_IMPORT_ENABLED", False
+    )
+    monkeypatch.setattr(
+        automation_module.settings, "TOKEN_AUTO_MAINTENANCE_ENABLED", True
+    )
+    monkeypatch.setattr(
+        automation_module.settings, "TOKEN_AUTO_REMOVE_DUPLICATES", True
+    )
+    maintenance_started = asyncio.Event()
+    maintenance_release = asyncio.Event()
+
+    async def fake_run_token_maintenance(**kwargs):
+        maintenance_started.set()
+        await maintenance_release.wait()
+        return automation_module.TokenMaintenanceSummary(
+            provider=kwargs["provider"],
+        )
+
+    monkeypatch.setattr(
+        automation_module,
+        "run_token_maintenance",
+        fake_run_token_maintenance,
+    )
+
+    scheduler = automation_module.TokenAutomationScheduler()
+    await scheduler.start()
+    try:
+        await asyncio.wait_for(maintenance_started.wait(), timeout=1)
+
+        _enable_import(monkeypatch)
+        scheduler.notify_settings_changed(
+            ["TOKEN_AUTO_IMPORT_ENABLED", "TOKEN_AUTO_IMPORT_SOURCE_DIR"]
+        )
+        await fake_import.wait_for_call()
+
+        assert fake_import.calls == ["/srv/tokens"]
+        assert not scheduler._job_tasks["maintenance"].done()
+    finally:
+        await asyncio.wait_for(scheduler.stop(), timeout=1)
+
+    assert scheduler._job_tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_unrelated_settings_change_does_not_rerun_enabled_import(
+    monkeypatch,
+    fake_import,
+):
+    _enable_import(monkeypatch)
+    monkeypatch.setattr(
+        automation_module.settings, "TOKEN_AUTO_MAINTENANCE_ENABLED", False
+    )
+
+    scheduler = automation_module.TokenAutomationScheduler()
+    monkeypatch.setattr(automation_module, "_scheduler", scheduler)
+    await scheduler.start()
+    try:
+        await fake_import.wait_for_call()
+        await _wait_until(lambda: _scheduler_is_idle(scheduler))
+
+        automation_module.notify_token_automation_settings_changed(
+            ["SERVICE_NAME", "ADMIN_PASSWORD"]
+        )
+        assert _scheduler_is_idle(scheduler)
+
+        automation_module.notify_token_automation_settings_changed(
+            ["TOKEN_AUTO_HEALTH_CHECK"]
+        )
+        assert scheduler._rescheduled_jobs == {"maintenance"}
+        await _wait_until(lambda: _scheduler_is_idle(scheduler))
+
+        assert fake_import.calls == ["/srv/tokens"]
+        assert scheduler._next_due["import"] is not None
+        assert scheduler._next_due["import"] > asyncio.get_running_loop().time()
+    finally:
+        await asyncio.wait_for(scheduler.stop(), timeout=1)
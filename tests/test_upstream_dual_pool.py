@@ -56,6 +56,9 @@ class StubTokenPool:
     def get_pool_status(self):
         return {"available_tokens": len(self.tokens)}
 
+    def count_available_tokens(self):
+        return len(self.tokens)
+
 
 class FakeResponse:
     def __init__(self, status_code: int, text: str = "{}"):